@@ -2,27 +2,42 @@
 
 __version__ = "0.1.0"
 
+from typing import Any
+
 # Core (always available)
-from agent_tools.vision.base import VisionClient, VisionResult
 from agent_tools.registry import list_tools, get_tool, discover
 
-# Optional providers (lazy import to avoid hard dependencies)
-try:
-    from agent_tools.vision.venice import VeniceVisionClient
-except ImportError:
-    VeniceVisionClient = None  # type: ignore
-
-try:
-    from agent_tools.vision.ollama import OllamaVisionClient
-except ImportError:
-    OllamaVisionClient = None  # type: ignore
-
 __all__ = [
     "VisionClient",
-    "VisionResult", 
+    "VisionResult",
     "VeniceVisionClient",
     "OllamaVisionClient",
     "list_tools",
     "get_tool",
     "discover",
 ]
+
+# Vision classes are resolved on first access (PEP 562) so that importing the
+# package, the registry, or the CLI doesn't pull in provider dependencies.
+# A missing provider dependency raises ImportError only when the class is used.
+_LAZY_IMPORTS = {
+    "VisionClient": "agent_tools.vision.base",
+    "VisionResult": "agent_tools.vision.base",
+    "VeniceVisionClient": "agent_tools.vision.venice",
+    "OllamaVisionClient": "agent_tools.vision.ollama",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,65 +1,84 @@
 #!/usr/bin/env python3
-"""CLI tool for discovering and using agent-tools."""
+"""CLI tool for discovering and using agent-tools.
+
+Usage:
+    agent-tools [list]    # Human-readable list of tools (default)
+    agent-tools json      # Machine-readable JSON
+    agent-tools check     # Verify environment configuration
+"""
 
-import argparse
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Optional faster JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+# Usage snippets shown by `agent-tools list`; all other metadata comes from the registry
+_EXAMPLES = {
+    "vision.ollama": 'OllamaVisionClient.from_env().analyze_image("img.png", "Describe")',
+    "vision.venice": 'VeniceVisionClient.from_env().analyze_image("img.png", "Describe")',
+}
+
 
+@lru_cache(maxsize=1)
 def discover_tools():
     """Discover all available tools in the package."""
-    tools = []
+    from agent_tools.registry import list_tools as registry_tools
     
-    # Import and introspect
-    try:
-        from agent_tools import vision
-        tools.append({
-            "name": "vision.ollama",
-            "description": "Ollama Cloud vision analysis (free, preferred)",
-            "class": "OllamaVisionClient",
-            "env": ["OLLAMA_HOST"],
-            "example": 'OllamaVisionClient.from_env().analyze_image("img.png", "Describe")'
-        })
-        tools.append({
-            "name": "vision.venice", 
-            "description": "Venice AI vision analysis (paid fallback)",
-            "class": "VeniceVisionClient",
-            "env": ["VENICE_API_KEY"],
-            "example": 'VeniceVisionClient.from_env().analyze_image("img.png", "Describe")'
-        })
-    except ImportError:
-        pass
-    
-    return tools
+    return [
+        {
+            "name": t.name,
+            "description": t.description,
+            "class": t.class_name,
+            "env": t.env_vars,
+            "example": _EXAMPLES.get(t.name, "-"),
+        }
+        for t in registry_tools()
+    ]
 
 
 def list_tools():
     """Print formatted list of available tools."""
     tools = discover_tools()
     
-    print("🛠️  Available Agent Tools\n")
-    print(f"Total: {len(tools)} tools\n")
-    
-    for tool in tools:
-        print(f"📦 {tool['name']}")
-        print(f"   {tool['description']}")
-        print(f"   Class: {tool['class']}")
-        print(f"   Requires: {', '.join(tool['env'])}")
-        print(f"   Example: {tool['example']}")
-        print()
+    out = ["🛠️  Available Agent Tools\n\n", f"Total: {len(tools)} tools\n\n"]
+    out.extend(
+        f"📦 {tool['name']}\n"
+        f"   {tool['description']}\n"
+        f"   Class: {tool['class']}\n"
+        f"   Requires: {', '.join(tool['env'])}\n"
+        f"   Example: {tool['example']}\n"
+        f"\n"
+        for tool in tools
+    )
+    sys.stdout.write("".join(out))
 
 
 def list_json():
     """Output tools as JSON for programmatic use."""
     tools = discover_tools()
-    print(json.dumps(tools, indent=2))
+    # orjson emits bytes; write them to the binary buffer when stdout has one
+    # (it doesn't when redirected to e.g. a StringIO)
+    out = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and out is not None:
+        sys.stdout.flush()
+        out.write(orjson.dumps(tools, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        out.flush()
+    else:
+        # Stream straight to stdout rather than building the full string first
+        json.dump(tools, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
 
 def check_setup():
     """Check if environment is properly configured."""
-    import os
-    
     print("🔍 Environment Check\n")
     
     checks = {
@@ -67,11 +86,12 @@ def check_setup():
         "VENICE_API_KEY": ("Venice AI vision", None),
     }
     
+    env = os.environ
     all_ok = True
     for env_var, (purpose, default) in checks.items():
-        value = os.environ.get(env_var)
+        value = env.get(env_var)
         if value:
-            display = value[:20] + "..." if len(value) > 20 else value
+            display = f"{value[:20]}..." if value[20:21] else value
             print(f"  ✅ {env_var}: {display}")
             print(f"     → {purpose} ready")
         else:
@@ -86,26 +106,27 @@ def check_setup():
 
 
 def main():
-    parser = argparse.ArgumentParser(
-        description="Agent Tools CLI - Discover and verify available tools"
-    )
-    parser.add_argument(
-        "command",
-        choices=["list", "json", "check"],
-        default="list",
-        nargs="?",
-        help="Command to run: list (human), json (machine), check (env verification)"
-    )
+    # Hand-rolled dispatch: three fixed subcommands don't justify argparse's import cost
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "list"
+    
+    if cmd in ("-h", "--help"):
+        print(__doc__)
+        return
     
-    args = parser.parse_args()
+    dispatch = {
+        "list": list_tools,
+        "json": list_json,
+        "check": lambda: sys.exit(0 if check_setup() else 1),
+    }
+    if cmd not in dispatch:
+        print(__doc__, file=sys.stderr)
+        print(
+            f"Error: unknown command {cmd!r} (choose from {', '.join(dispatch)})",
+            file=sys.stderr,
+        )
+        sys.exit(2)
     
-    if args.command == "list":
-        list_tools()
-    elif args.command == "json":
-        list_json()
-    elif args.command == "check":
-        ok = check_setup()
-        sys.exit(0 if ok else 1)
+    dispatch[cmd]()
 
 
 if __name__ == "__main__":
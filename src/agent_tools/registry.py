@@ -18,10 +18,15 @@ Example:
     OllamaVisionClient = get_tool("vision.ollama")
 """
 
-from dataclasses import dataclass
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Callable, Type, Any
 from importlib import import_module
 
+_environ = os.environ
+
 
 @dataclass
 class ToolInfo:
@@ -33,12 +38,15 @@ class ToolInfo:
     class_name: str
     env_vars: list[str]  # Required environment variables
     is_available: Callable[[], bool]  # Check if configured
+    _cls_cache: Type[Any] | None = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def cls(self) -> Type[Any]:
-        """Dynamically import and return the tool class."""
-        module = import_module(self.module_path)
-        return getattr(module, self.class_name)
+        """Dynamically import and return the tool class (cached after first access)."""
+        if self._cls_cache is None:
+            module = sys.modules.get(self.module_path) or import_module(self.module_path)
+            self._cls_cache = getattr(module, self.class_name)
+        return self._cls_cache
 
 
 # Registry of all tools
@@ -61,11 +69,36 @@ _REGISTRY: list[ToolInfo] = [
     ),
 ]
 
+# Name -> ToolInfo index for O(1) lookups; call _rebuild_index() after mutating _REGISTRY
+_REGISTRY_BY_NAME: dict[str, ToolInfo] = {t.name: t for t in _REGISTRY}
+
+
+# Bumped whenever the registry changes; keys the cached discover() result
+_registry_version = 0
+
 
+def _rebuild_index() -> None:
+    """Rebuild the name index from _REGISTRY."""
+    global _registry_version
+    _REGISTRY_BY_NAME.clear()
+    _REGISTRY_BY_NAME.update((t.name, t) for t in _REGISTRY)
+    _registry_version += 1
+
+
+@lru_cache(maxsize=None)
 def _check_env(var: str) -> str | None:
-    """Check if an environment variable is set."""
-    import os
-    return os.environ.get(var)
+    """Check if an environment variable is set.
+    
+    Results are cached for the life of the process; call
+    ``_invalidate_env_cache()`` after changing the environment.
+    """
+    return _environ.get(var)
+
+
+def _invalidate_env_cache() -> None:
+    """Clear cached environment lookups (e.g. after load_dotenv or in tests)."""
+    _check_env.cache_clear()
+    _discover_cached.cache_clear()
 
 
 def list_tools(only_available: bool = False) -> list[ToolInfo]:
@@ -94,10 +127,7 @@ def get_tool(name: str) -> Type[Any]:
     Raises:
         KeyError: If tool not found
     """
-    for tool in _REGISTRY:
-        if tool.name == name:
-            return tool.cls
-    raise KeyError(f"Tool '{name}' not found. Available: {[t.name for t in _REGISTRY]}")
+    return get_tool_info(name).cls
 
 
 def get_tool_info(name: str) -> ToolInfo:
@@ -112,18 +142,27 @@ def get_tool_info(name: str) -> ToolInfo:
     Raises:
         KeyError: If tool not found
     """
-    for tool in _REGISTRY:
-        if tool.name == name:
-            return tool
-    raise KeyError(f"Tool '{name}' not found")
+    try:
+        return _REGISTRY_BY_NAME[name]
+    except KeyError:
+        raise KeyError(f"Tool '{name}' not found. Available: {list(_REGISTRY_BY_NAME)}") from None
 
 
 def discover() -> dict:
     """Return discovery info as serializable dict.
     
+    The result is cached until the registry or environment cache changes;
+    treat it as read-only.
+    
     Returns:
         Dictionary with tool info suitable for JSON serialization
     """
+    return _discover_cached(_registry_version)
+
+
+@lru_cache(maxsize=1)
+def _discover_cached(version: int) -> dict:
+    avail = [t.is_available() for t in _REGISTRY]
     return {
         "tools": [
             {
@@ -132,10 +171,10 @@ def discover() -> dict:
                 "module": t.module_path,
                 "class": t.class_name,
                 "requires_env": t.env_vars,
-                "available": t.is_available(),
+                "available": ok,
             }
-            for t in _REGISTRY
+            for t, ok in zip(_REGISTRY, avail)
         ],
         "total": len(_REGISTRY),
-        "available": sum(1 for t in _REGISTRY if t.is_available()),
+        "available": sum(avail),
     }
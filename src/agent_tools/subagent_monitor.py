@@ -11,13 +11,176 @@ Usage:
 
 import subprocess
 import json
+import os
+import socket
+import struct
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+# Optional faster JSON decoder; orjson.JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Seconds between refreshes in --watch mode
+_WATCH_INTERVAL = 30
+
+
+# Session key markers checked in order: (marker, max tail length, display tag).
+# A tag of None collapses the display name to the marker itself.
+_DISPLAY_PREFIXES = (
+    ("discord:channel:", 35, ""),
+    ("cron:", 30, "cron:"),
+    ("main", None, None),
+)
+
+
+_STATUS_EMOJI = {
+    "healthy": "🟢",
+    "crashed": "🔴",
+    "stalled": "🟡",
+    "suspect": "🟠",
+}
+
+# Report row templates for print_report (standard and --details views)
+_LINE_TMPL_STD = (
+    "{emoji} {id:<8} {kind:<6} {status:<8} {idle:>7} {tokens:>8} {model:<18} {name:<28} {issues}"
+)
+_LINE_TMPL_DETAILS = (
+    "{emoji} {id:<8} {kind:<6} {status:<8} {idle:>7} {tokens:>8} {model:<18} {preview:<42}"
+)
+
+
+# Resident openclaw daemon; used instead of forking the CLI when the socket exists
+_DAEMON_SOCKET = os.environ.get("OPENCLAW_SOCKET", "/run/openclaw.sock")
+_conn = None
+
+
+def _recv_exact(conn, n):
+    """Read exactly n bytes from a socket."""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = conn.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("openclaw daemon closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+def _daemon_request(request):
+    """Send a length-prefixed JSON request to the openclaw daemon.
+    
+    The connection is opened once and reused across calls (e.g. watch mode
+    ticks), reconnecting once if it has gone away.
+    
+    Returns:
+        The decoded reply, or None if the daemon isn't available
+    """
+    global _conn
+    payload = json.dumps(request).encode()
+    for _ in range(2):
+        if _conn is None:
+            if not hasattr(socket, "AF_UNIX") or not os.path.exists(_DAEMON_SOCKET):
+                return None
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.settimeout(30)
+            try:
+                conn.connect(_DAEMON_SOCKET)
+            except OSError:
+                conn.close()
+                return None
+            _conn = conn
+        try:
+            _conn.sendall(struct.pack(">I", len(payload)) + payload)
+            (length,) = struct.unpack(">I", _recv_exact(_conn, 4))
+            return _json_loads(_recv_exact(_conn, length))
+        except (OSError, ValueError):
+            # BrokenPipeError/ConnectionError/timeout or a garbled reply: drop and retry
+            _conn.close()
+            _conn = None
+    return None
 
 
 def get_sessions(active_minutes=60, subagents_only=False, channels_only=False):
     """Get list of sessions, optionally filtering for isolated (sub-agent) or channels only."""
+    request = {"cmd": "sessions.list", "activeMinutes": active_minutes}
+    if subagents_only:
+        request["kinds"] = ["isolated"]
+    elif channels_only:
+        request["kinds"] = ["group"]
+    reply = _daemon_request(request)
+    # Anything else (e.g. an error reply) falls through to the CLI
+    if isinstance(reply, dict) and "sessions" in reply:
+        return _filter_sessions(reply["sessions"], subagents_only, channels_only)
+    
+    cmd = _sessions_list_cmd(active_minutes, subagents_only, channels_only)
+    
+    # Keep stdout/stderr as bytes - json and orjson both decode bytes directly,
+    # so the output is never transcoded to str; stderr is decoded only to print it
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        print(f"Error: {result.stderr.decode(errors='replace')}", file=sys.stderr)
+        return []
+    return _parse_sessions(result.stdout, subagents_only, channels_only)
+
+
+# Cleared the first time openclaw rejects --with-history as an unknown option,
+# so later calls skip straight to the fallback
+_with_history_supported = True
+
+# Lowercased stderr fragments meaning openclaw doesn't know an option or subcommand we passed
+_UNSUPPORTED_MARKERS = (
+    "unknown option", "unrecognized option", "unrecognised option",
+    "unknown command", "unrecognized command", "unrecognised command",
+)
+
+
+def _unsupported(result):
+    """True if a failed openclaw run rejected its arguments (usage error).
+    
+    Other failures (e.g. the gateway being briefly down) are transient and
+    shouldn't disable a feature for the rest of the process.
+    """
+    if result.returncode == 2:  # conventional usage-error exit status
+        return True
+    stderr = result.stderr.decode(errors="replace").lower()
+    return any(marker in stderr for marker in _UNSUPPORTED_MARKERS)
+
+
+def get_sessions_with_history(
+    active_minutes=60, history_limit=3, subagents_only=False, channels_only=False
+):
+    """Get sessions with their recent history attached, in a single openclaw call.
+    
+    Each returned session carries a "history" list of messages. If the installed
+    openclaw doesn't support --with-history, falls back to get_sessions() and the
+    sessions have no "history" key, so callers fetch history per session instead.
+    """
+    global _with_history_supported
+    if _with_history_supported:
+        cmd = _sessions_list_cmd(active_minutes, subagents_only, channels_only)
+        cmd.extend(["--with-history", "--history-limit", str(history_limit)])
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode == 0:
+            return _parse_sessions(result.stdout, subagents_only, channels_only)
+        if not _unsupported(result):
+            # Transient failure: report it and try --with-history again next time
+            print(f"Error: {result.stderr.decode(errors='replace')}", file=sys.stderr)
+            return []
+        _with_history_supported = False
+    return get_sessions(active_minutes, subagents_only=subagents_only, channels_only=channels_only)
+
+
+def _sessions_list_cmd(active_minutes, subagents_only, channels_only):
+    """Build the `openclaw sessions list` command line."""
     # Build command - CLI accepts multiple --kinds flags or comma-separated
     cmd = ["openclaw", "sessions", "list", "--active-minutes", str(active_minutes), "--json"]
     
@@ -28,52 +191,124 @@ def get_sessions(active_minutes=60, subagents_only=False, channels_only=False):
     elif channels_only:
         # Filter for group (channel) sessions
         cmd.extend(["--kinds", "group"])
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Error: {result.stderr}", file=sys.stderr)
-        return []
+    return cmd
+
+
+def _parse_sessions(stdout, subagents_only, channels_only):
+    """Parse `openclaw sessions list --json` output and apply kind filters."""
     try:
-        data = json.loads(result.stdout)
+        data = _json_loads(stdout)
         sessions = data.get("sessions", [])
-        # Post-filter: apply kind filters
-        if subagents_only:
-            sessions = [s for s in sessions if s.get("kind") == "isolated"]
-        elif channels_only:
-            sessions = [s for s in sessions if s.get("kind") == "group"]
-        return sessions
     except json.JSONDecodeError:
-        sessions = []
-        for line in result.stdout.strip().split("\n"):
-            if line:
+        # Newline-delimited sessions: decode them all as one JSON array
+        lines = [line for line in stdout.split(b"\n") if line.strip()]
+        try:
+            sessions = _json_loads(b"[" + b",".join(lines) + b"]")
+        except json.JSONDecodeError:
+            # Some line is malformed; keep the ones that parse
+            sessions = []
+            for line in lines:
                 try:
-                    s = json.loads(line)
-                    if subagents_only and s.get("kind") == "isolated":
-                        sessions.append(s)
-                    elif channels_only and s.get("kind") == "group":
-                        sessions.append(s)
-                    elif not subagents_only and not channels_only:
-                        sessions.append(s)
-                except:
+                    sessions.append(_json_loads(line))
+                except json.JSONDecodeError:
                     pass
-        return sessions
+    return _filter_sessions(sessions, subagents_only, channels_only)
+
+
+def _filter_sessions(sessions, subagents_only, channels_only):
+    """Post-filter: apply kind filters."""
+    if subagents_only:
+        return [s for s in sessions if s.get("kind") == "isolated"]
+    elif channels_only:
+        return [s for s in sessions if s.get("kind") == "group"]
+    return sessions
 
 
 def get_session_history(session_key, limit=5):
     """Get messages from a session to extract task/prompt."""
     result = subprocess.run(
         ["openclaw", "sessions", "history", session_key, "--limit", str(limit), "--json"],
-        capture_output=True, text=True
+        capture_output=True
     )
     if result.returncode != 0:
         return None
     try:
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         return data.get("messages", [])
     except:
         return None
 
 
+# Cleared the first time openclaw rejects `sessions history-bulk` as unknown
+_history_bulk_supported = True
+
+
+def get_session_histories(session_keys, limit=5):
+    """Get messages for several sessions with a single openclaw call.
+    
+    Expects `openclaw sessions history-bulk` to emit {"histories": {key: [messages]}}.
+    
+    Returns:
+        Dict mapping session key to its messages, or None if the installed
+        openclaw doesn't support bulk history (callers then fetch per session).
+    """
+    global _history_bulk_supported
+    if not _history_bulk_supported:
+        return None
+    result = subprocess.run(
+        ["openclaw", "sessions", "history-bulk", "--keys", ",".join(session_keys),
+         "--limit", str(limit), "--json"],
+        capture_output=True
+    )
+    if result.returncode != 0:
+        if _unsupported(result):
+            _history_bulk_supported = False
+        else:
+            # Transient failure: fall back for now, try bulk again next time
+            print(f"Error: {result.stderr.decode(errors='replace')}", file=sys.stderr)
+        return None
+    try:
+        return _json_loads(result.stdout).get("histories", {})
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+
+# Successful history fetches keyed by (session key, updatedAt, limit); oldest evicted first
+_HISTORY_CACHE = {}
+_HISTORY_CACHE_MAX = 256
+_history_cache_lock = threading.Lock()
+
+
+def _get_session_history_cached(session_key, updated_at, limit=5):
+    """Memoized get_session_history, keyed on the session's updatedAt.
+    
+    A session that hasn't changed since the last report (e.g. between
+    --watch ticks) reuses its previous history instead of re-running openclaw.
+    Failed fetches (None) aren't cached, so they're retried next time.
+    """
+    history = _HISTORY_CACHE.get((session_key, updated_at, limit))
+    if history is not None:
+        return history
+    history = get_session_history(session_key, limit=limit)
+    if history is not None:
+        _store_history(session_key, updated_at, limit, history)
+    return history
+
+
+def _store_history(session_key, updated_at, limit, history):
+    """Add a successfully fetched history to the cache, evicting the oldest entry."""
+    with _history_cache_lock:
+        if len(_HISTORY_CACHE) >= _HISTORY_CACHE_MAX:
+            del _HISTORY_CACHE[next(iter(_HISTORY_CACHE))]
+        _HISTORY_CACHE[(session_key, updated_at, limit)] = history
+
+
+def _clear_history_cache():
+    """Forget cached session histories (e.g. in tests)."""
+    with _history_cache_lock:
+        _HISTORY_CACHE.clear()
+
+
 def extract_task_prompt(messages):
     """Extract the initial task prompt from session history.
     
@@ -125,9 +360,30 @@ def extract_model(messages):
 
 
 def format_timestamp(ts_ms):
-    """Convert epoch ms to readable time."""
-    dt = datetime.fromtimestamp(ts_ms / 1000)
-    return dt.strftime("%H:%M:%S")
+    """Convert epoch ms to readable time.
+    
+    Formats local HH:MM:SS with divmod rather than building a datetime; the
+    DST-aware UTC offset comes from _utc_offset.
+    """
+    return _format_timestamp_cached(int(ts_ms) // 1000)
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp_cached(ts_s):
+    local_s = (ts_s + _utc_offset(ts_s // 900)) % 86400
+    h, rem = divmod(local_s, 3600)
+    m, sec = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{sec:02d}"
+
+
+@lru_cache(maxsize=64)
+def _utc_offset(bucket):
+    """Local UTC offset in seconds for a 15-minute epoch bucket (DST-aware).
+    
+    DST transitions fall on quarter-hour UTC boundaries, so the offset is
+    constant within a bucket.
+    """
+    return time.localtime(bucket * 900).tm_gmtoff
 
 
 def format_total_tokens(tokens):
@@ -139,8 +395,14 @@ def format_total_tokens(tokens):
 
 def format_duration(minutes):
     """Format duration in a readable way."""
+    return _format_duration_cached(round(minutes * 60))
+
+
+@lru_cache(maxsize=512)
+def _format_duration_cached(seconds):
+    minutes = seconds / 60
     if minutes < 1:
-        return f"{minutes*60:.0f}s"
+        return f"{seconds}s"
     elif minutes < 60:
         return f"{minutes:.1f}m"
     else:
@@ -148,20 +410,34 @@ def format_duration(minutes):
         return f"{hours:.1f}h"
 
 
-def check_health(session, stuck_threshold=10):
+def _display_name(key):
+    """Build a short display name from the first matching session key marker."""
+    for marker, limit, tag in _DISPLAY_PREFIXES:
+        # `in` is a cheap C-level scan; only split the key on the marker that matches
+        if marker in key:
+            return marker if tag is None else tag + key.rpartition(marker)[2][:limit]
+    return key[:40]
+
+
+def check_health(session, stuck_threshold=10, now_ms=None):
     """Check health status of a sub-agent session.
     
     Args:
         stuck_threshold: Minutes of idle time before marking as 'suspect'
+        now_ms: Epoch time in ms to measure idle time from (default: now);
+            check_health_batch passes one snapshot for the whole report
     """
-    key = session.get("key", session.get("sessionKey", "unknown"))
-    kind = session.get("kind", "unknown")
-    updated_at = session.get("updatedAt", 0)
-    total_tokens = session.get("totalTokens")  # Can be None
-    system_sent = session.get("systemSent", False)
-    aborted = session.get("abortedLastRun", False)
-    session_id = session.get("sessionId", "-")[:8]
-    model = session.get("model", "-")
+    if now_ms is None:
+        now_ms = time.time_ns() // 1_000_000
+    get = session.get  # bind once; saves a method lookup per field
+    key = get("key", get("sessionKey", "unknown"))
+    kind = get("kind", "unknown")
+    updated_at = get("updatedAt", 0)
+    total_tokens = get("totalTokens")  # Can be None
+    system_sent = get("systemSent", False)
+    aborted = get("abortedLastRun", False)
+    session_id = get("sessionId", "-")[:8]
+    model = get("model", "-")
     
     # Shorten model name
     if model and model != "-":
@@ -170,19 +446,9 @@ def check_health(session, stuck_threshold=10):
         if len(model) > 18:
             model = model[:15] + "..."
     
-    # Build display name
-    display = key
-    if "discord:channel:" in key:
-        display = key.split("discord:channel:")[-1][:35]
-    elif "cron:" in key:
-        display = "cron:" + key.split("cron:")[-1][:30]
-    elif "main" in key:
-        display = "main"
-    else:
-        display = key[:40]
+    display = _display_name(key)
 
-    now = datetime.now().timestamp() * 1000
-    idle_ms = now - updated_at
+    idle_ms = now_ms - updated_at
     idle_min = idle_ms / 60000
 
     issues = []
@@ -213,13 +479,33 @@ def check_health(session, stuck_threshold=10):
         "total_tokens": total_tokens,
         "model": model,
         "issues": issues,
+        "updated_at": updated_at,
         "last_update": format_timestamp(updated_at),
         "system_sent": system_sent
     }
 
 
+def check_health_batch(sessions, stuck_threshold=10, now_ms=None):
+    """Check health of many sessions against a single clock snapshot.
+    
+    Args:
+        sessions: Session dicts as returned by get_sessions()
+        stuck_threshold: Minutes of idle time before marking as 'suspect'
+        now_ms: Epoch time in ms to measure idle time from (default: now)
+        
+    Returns:
+        List of health dicts (see check_health), in the same order as sessions
+    """
+    if now_ms is None:
+        now_ms = time.time_ns() // 1_000_000
+    return [check_health(s, stuck_threshold, now_ms) for s in sessions]
+
+
 def print_report(sessions, show_details=False, stuck_threshold=10, channels_only=False):
-    """Print formatted health report."""
+    """Print formatted health report.
+    
+    `sessions` (as returned by get_sessions) is sorted in place, newest first.
+    """
     if not sessions:
         if channels_only:
             kind_filter = "channels"
@@ -236,7 +522,7 @@ def print_report(sessions, show_details=False, stuck_threshold=10, channels_only
         kind_label = "Sub-Agent"
     else:
         kind_label = "Session"
-    print(f"\n🤖 {kind_label} Health Report ({len(sessions)} total)\n")
+    title = f"\n🤖 {kind_label} Health Report ({len(sessions)} total)\n"
     
     # Base header columns
     base_header = f"{'ID':<10} {'Kind':<6} {'Status':<8} {'Idle':>7} {'Tokens':>8} {'Model':<18}"
@@ -246,76 +532,122 @@ def print_report(sessions, show_details=False, stuck_threshold=10, channels_only
     else:
         header = base_header + f" {'Channel/Key':<28} Issues"
     
-    # Calculate max width
-    max_width = len(header)
-    health_data = []
+    sessions.sort(key=lambda s: s.get("updatedAt", 0), reverse=True)
+    healths = check_health_batch(sessions, stuck_threshold)
     
-    for s in sorted(sessions, key=lambda x: x.get("updatedAt", 0), reverse=True):
-        health = check_health(s, stuck_threshold)
-        
-        # Get additional details if requested
-        task_preview = "-"
-        if show_details:
-            history = get_session_history(health["key"], limit=3)
-            task_preview = extract_task_prompt(history)
-            # Update model from history if not in session data
-            if health["model"] == "-" and history:
-                health["model"] = extract_model(history)
-        
-        health_data.append((health, task_preview))
-        
-        # Calculate line length for separator
-        if show_details:
-            tok_str = format_total_tokens(health['total_tokens'])
-            line = (f"🟢 {health['id']:<8} {health['kind']:<6} {health['status']:<8} "
-                    f"{format_duration(health['idle_min']):>7} {tok_str:<8} "
-                    f"{health['model']:<18} {task_preview:<42}")
-        else:
-            issues_str = ", ".join(health["issues"]) if health["issues"] else "-"
-            short_name = health["display"][:26] + ".." if len(health["display"]) > 28 else health["display"]
-            tok_str = format_total_tokens(health['total_tokens'])
-            line = (f"🟢 {health['id']:<8} {health['kind']:<6} {health['status']:<8} "
-                    f"{format_duration(health['idle_min']):>7} {tok_str:<8} "
-                    f"{health['model']:<18} {short_name:<28} {issues_str}")
-        max_width = max(max_width, len(line))
+    # Use history attached by get_sessions_with_history() where present
+    histories = [s.get("history") for s in sessions]
+    missing = [i for i, s in enumerate(sessions) if "history" not in s]
+    if show_details and missing:
+        # Sessions unchanged since the last report reuse their cached history
+        uncached = []
+        for i in missing:
+            history = _HISTORY_CACHE.get((healths[i]["key"], healths[i]["updated_at"], 3))
+            if history is None:
+                uncached.append(i)
+            else:
+                histories[i] = history
+        missing = uncached
+    if show_details and missing:
+        bulk = get_session_histories([healths[i]["key"] for i in missing], limit=3)
+        if bulk is not None:
+            # Keys absent from the bulk reply stay missing and are fetched below
+            uncached = []
+            for i in missing:
+                history = bulk.get(healths[i]["key"])
+                if history is None:
+                    uncached.append(i)
+                else:
+                    histories[i] = history
+                    _store_history(healths[i]["key"], healths[i]["updated_at"], 3, history)
+            missing = uncached
+    if show_details and missing:
+        # Fetch the rest concurrently - each call is an openclaw subprocess,
+        # so threads overlap the waits instead of running them back to back
+        with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+            fetched = executor.map(
+                lambda i: _get_session_history_cached(
+                    healths[i]["key"], healths[i]["updated_at"], limit=3
+                ),
+                missing,
+            )
+            for i, history in zip(missing, fetched):
+                histories[i] = history
     
-    print(header)
-    print("-" * max_width)
-
-    for health, task_preview in health_data:
-        status_emoji = {
-            "healthy": "🟢",
-            "crashed": "🔴",
-            "stalled": "🟡",
-            "suspect": "🟠"
-        }.get(health["status"], "⚪")
+    # Format each row once, tracking the widest for the separator
+    max_width = len(header)
+    lines = []
+    
+    for health, history in zip(healths, histories):
+        status_emoji = _STATUS_EMOJI.get(health["status"], "⚪")
 
         idle_str = format_duration(health["idle_min"])
         tok_str = format_total_tokens(health["total_tokens"])
 
+        # Update model from history if not in session data
+        if show_details and health["model"] == "-" and history:
+            health["model"] = extract_model(history)
+
+        row = {
+            "emoji": status_emoji,
+            "id": health["id"],
+            "kind": health["kind"],
+            "status": health["status"],
+            "idle": idle_str,
+            "tokens": tok_str,
+            "model": health["model"],
+        }
+
         if show_details:
             # Detailed view: Task preview instead of channel key
-            line = (f"{status_emoji} {health['id']:<8} "
-                    f"{health['kind']:<6} "
-                    f"{health['status']:<8} "
-                    f"{idle_str:>7} "
-                    f"{tok_str:>8} "
-                    f"{health['model']:<18} "
-                    f"{task_preview:<42}")
+            row["preview"] = extract_task_prompt(history)
+            line = _LINE_TMPL_DETAILS.format_map(row)
         else:
             # Standard view: Channel key + issues
-            short_name = health["display"][:26] + ".." if len(health["display"]) > 28 else health["display"]
-            issues_str = ", ".join(health["issues"]) if health["issues"] else "-"
-            
-            line = (f"{status_emoji} {health['id']:<8} "
-                    f"{health['kind']:<6} "
-                    f"{health['status']:<8} "
-                    f"{idle_str:>7} "
-                    f"{tok_str:>8} "
-                    f"{health['model']:<18} "
-                    f"{short_name:<28} "
-                    f"{issues_str}")
-        print(line)
+            row["name"] = health["display"][:26] + ".." if len(health["display"]) > 28 else health["display"]
+            row["issues"] = ", ".join(health["issues"]) if health["issues"] else "-"
+            line = _LINE_TMPL_STD.format_map(row)
+        lines.append(line)
+        max_width = max(max_width, len(line))
+    
+    _write_out(f"{title}\n{header}\n{'-' * max_width}\n" + "\n".join(lines) + "\n")
+
+
+def _write_out(text):
+    """Write a whole report to stdout in one go and flush it.
+    
+    Encodes once and writes to the binary buffer, bypassing the text layer's
+    incremental encoder; falls back to a text write when stdout has no buffer
+    (e.g. redirected to a StringIO).
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()  # keep ordering with anything already written as text
+    out.write(text.encode(sys.stdout.encoding or "utf-8", sys.stdout.errors or "strict"))
+    out.flush()
+
+
+def _run_in_daemon_thread(fn):
+    """Run fn on a daemon thread and return a Future for its result.
+    
+    Daemon threads aren't joined at interpreter exit, so leaving watch mode
+    doesn't wait for an openclaw call that is still in flight.
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name="watch-prefetch", daemon=True).start()
+    return future
 
 
 def watch_mode(subagents_only=False, channels_only=False, show_details=False, stuck_threshold=10):
@@ -327,13 +659,36 @@ def watch_mode(subagents_only=False, channels_only=False, show_details=False, st
     else:
         kind_label = "sessions"
     print(f"👀 Watching {kind_label} (Ctrl+C to exit)...")
+    
+    fetch = get_sessions_with_history if show_details else get_sessions
+    
+    def timed_fetch():
+        started = time.monotonic()
+        sessions = fetch(
+            active_minutes=120, subagents_only=subagents_only, channels_only=channels_only
+        )
+        return sessions, time.monotonic() - started
+    
+    # Fetch in a background thread so the next listing is already in flight
+    # while we wait out the interval, instead of stalling the tick on openclaw
     try:
+        pending = _run_in_daemon_thread(timed_fetch)
         while True:
-            subprocess.run(["clear"])
-            sessions = get_sessions(active_minutes=120, subagents_only=subagents_only, channels_only=channels_only)
+            sessions, fetch_secs = pending.result()
+            # Home cursor + clear screen; avoids forking `clear` every tick.
+            # Skipped when piped so logs don't fill up with escape codes.
+            if sys.stdout.isatty():
+                sys.stdout.write("\x1b[H\x1b[2J")
+                sys.stdout.flush()
             print_report(sessions, show_details=show_details, stuck_threshold=stuck_threshold, channels_only=channels_only)
-            print(f"\n⏱️  Last check: {datetime.now().strftime('%H:%M:%S')} | Stuck threshold: {stuck_threshold}min")
-            time.sleep(30)
+            print(f"\n⏱️  Last check: {datetime.now().strftime('%H:%M:%S')} | Stuck threshold: {stuck_threshold}min",
+                  flush=True)
+            # Start the next fetch one fetch-duration before the interval ends,
+            # so it lands on time with fresh (not interval-old) data
+            lead = min(fetch_secs, _WATCH_INTERVAL)
+            time.sleep(_WATCH_INTERVAL - lead)
+            pending = _run_in_daemon_thread(timed_fetch)
+            time.sleep(lead)
     except KeyboardInterrupt:
         print("\n👋 Exiting watch mode.")
         sys.exit(0)
@@ -378,7 +733,10 @@ Examples:
     if watch:
         watch_mode(subagents_only=subagents_only, channels_only=channels_only, show_details=show_details, stuck_threshold=stuck_threshold)
     else:
-        sessions = get_sessions(active_minutes=60, subagents_only=subagents_only, channels_only=channels_only)
+        fetch = get_sessions_with_history if show_details else get_sessions
+        sessions = fetch(
+            active_minutes=60, subagents_only=subagents_only, channels_only=channels_only
+        )
         print_report(sessions, show_details=show_details, stuck_threshold=stuck_threshold, channels_only=channels_only)
 
 
@@ -1,5 +1,6 @@
 """Shared utilities for agent tools."""
 
 from agent_tools.utils.config import get_env, load_dotenv
+from agent_tools.utils.settings import Settings, get_settings
 
-__all__ = ["get_env", "load_dotenv"]
+__all__ = ["get_env", "load_dotenv", "Settings", "get_settings"]
@@ -1,12 +1,28 @@
 """Configuration utilities for environment-driven setup."""
 
 import os
+import re
+import warnings
 from pathlib import Path
 
+from agent_tools.registry import _invalidate_env_cache
+
+# One `KEY=value` assignment per line; comment lines (leading '#') never match.
+# Values are taken verbatim to end of line, then stripped of whitespace and quotes.
+_DOTENV_RE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=(.*)$", re.MULTILINE)
+
+# Parsed .env contents keyed by (path, mtime_ns) so unchanged files are parsed once
+_DOTENV_CACHE: dict[tuple[str, int], dict[str, str]] = {}
+
+# Resolved .env location (or None) per working directory, to skip the parent walk
+_DOTENV_PATH_CACHE: dict[str, Path | None] = {}
+
 
 def get_env(key: str, default: str | None = None, required: bool = False) -> str | None:
     """Get an environment variable with optional default and required check.
     
+    Deprecated: use agent_tools.utils.settings.get_settings() instead.
+    
     Args:
         key: Environment variable name
         default: Default value if not set
@@ -18,6 +34,11 @@ def get_env(key: str, default: str | None = None, required: bool = False) -> str
     Raises:
         ValueError: If required=True and variable is not set
     """
+    warnings.warn(
+        "get_env is deprecated; use agent_tools.utils.settings.get_settings()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     value = os.environ.get(key, default)
     if required and value is None:
         raise ValueError(f"Required environment variable {key} is not set")
@@ -27,30 +48,60 @@ def get_env(key: str, default: str | None = None, required: bool = False) -> str
 def load_dotenv(env_path: Path | None = None) -> None:
     """Load environment variables from a .env file.
     
+    Existing variables are never overridden. If any variable is set, the
+    registry's cached availability checks are invalidated.
+    
     Args:
         env_path: Path to .env file. If None, looks for .env in current directory
                  and working up to root.
     """
     if env_path is None:
-        # Search upward from current directory
-        current = Path.cwd()
-        for path in [current] + list(current.parents):
-            dotenv = path / ".env"
-            if dotenv.exists():
-                env_path = dotenv
-                break
-    
-    if env_path is None or not env_path.exists():
+        env_path = _find_dotenv(os.getcwd())
+    
+    if env_path is None:
         return
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except OSError:
+        return
+    
+    cache_key = (str(env_path), mtime_ns)
+    values = _DOTENV_CACHE.get(cache_key)
+    if values is None:
+        values = {}
+        for key, value in _DOTENV_RE.findall(env_path.read_text()):
+            values.setdefault(key, value.strip().strip('"\''))  # First assignment wins
+        _DOTENV_CACHE[cache_key] = values
     
-    with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"\'')
-                if key not in os.environ:  # Don't override existing
-                    os.environ[key] = value
+    environ = os.environ
+    changed = False
+    for key, value in values.items():
+        if key not in environ:  # Don't override existing
+            environ[key] = value
+            changed = True
+    if changed:
+        _invalidate_env_cache()
+
+
+def _find_dotenv(cwd: str) -> Path | None:
+    """Find the nearest .env in cwd or its parents (cached per cwd)."""
+    try:
+        return _DOTENV_PATH_CACHE[cwd]
+    except KeyError:
+        pass
+    
+    found = None
+    current = Path(cwd)
+    for path in [current] + list(current.parents):
+        dotenv = path / ".env"
+        if dotenv.exists():
+            found = dotenv
+            break
+    _DOTENV_PATH_CACHE[cwd] = found
+    return found
+
+
+def _dotenv_cache_clear() -> None:
+    """Forget cached .env locations and parsed contents."""
+    _DOTENV_PATH_CACHE.clear()
+    _DOTENV_CACHE.clear()
@@ -0,0 +1,37 @@
+"""Typed settings read from the environment once per process."""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from agent_tools.utils.config import load_dotenv
+
+DEFAULT_OLLAMA_HOST = "http://127.0.0.1:11434"
+
+
+@dataclass(slots=True, frozen=True)
+class Settings:
+    """Provider configuration resolved from environment variables."""
+    
+    ollama_host: str = DEFAULT_OLLAMA_HOST
+    venice_api_key: str | None = None
+    
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read settings from os.environ (no .env loading)."""
+        env = os.environ
+        return cls(
+            ollama_host=env.get("OLLAMA_HOST", DEFAULT_OLLAMA_HOST),
+            venice_api_key=env.get("VENICE_API_KEY"),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, loading .env on first use.
+    
+    The result is cached; call get_settings.cache_clear() after changing
+    the environment to re-read it.
+    """
+    load_dotenv()
+    return Settings.from_env()
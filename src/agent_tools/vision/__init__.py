@@ -1,17 +1,8 @@
 """Vision and image analysis tools."""
 
-from agent_tools.vision.base import VisionClient, VisionResult
-
-# Lazy imports to avoid hard dependency on all providers
-try:
-    from agent_tools.vision.ollama import OllamaVisionClient
-except ImportError:
-    OllamaVisionClient = None  # type: ignore
+from typing import Any
 
-try:
-    from agent_tools.vision.venice import VeniceVisionClient
-except ImportError:
-    VeniceVisionClient = None  # type: ignore
+from agent_tools.vision.base import VisionClient, VisionResult
 
 __all__ = [
     "VisionClient",
@@ -19,3 +10,25 @@ __all__ = [
     "OllamaVisionClient",
     "VeniceVisionClient",
 ]
+
+# Providers are imported on first access (PEP 562) to avoid a hard dependency
+# on every provider's SDK when only one of them is used.
+_LAZY_IMPORTS = {
+    "OllamaVisionClient": "agent_tools.vision.ollama",
+    "VeniceVisionClient": "agent_tools.vision.venice",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,14 +1,29 @@
 """Base interfaces for vision clients."""
 
+import asyncio
+import base64
+import mmap
+import os
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
+from typing import Sequence, Union
 
+# Images larger than this are memory-mapped rather than read into a bytes copy
+_MMAP_THRESHOLD = 16 * 1024 * 1024
 
-@dataclass
+# Encoded data URLs keyed by (path, mtime_ns, size), bounded by total bytes;
+# the oldest entries are evicted first
+_ENCODE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_ENCODE_CACHE: dict[tuple[str, int, int], bytes] = {}
+_encode_cache_bytes = 0
+_encode_cache_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class VisionResult:
-    """Result of an image analysis operation."""
+    """Result of an image analysis operation (immutable)."""
     
     description: str
     raw_response: dict | None = None
@@ -40,8 +55,88 @@ class VisionClient(ABC):
         """
         raise NotImplementedError
     
+    async def analyze_images_batch(
+        self,
+        pairs: Sequence[tuple[Union[str, Path], str]],
+        concurrency: int = 8,
+        **kwargs
+    ) -> list[VisionResult]:
+        """Analyze several images concurrently.
+        
+        The default implementation runs analyze_image in worker threads,
+        at most `concurrency` at a time. Providers with an async HTTP client
+        may override this.
+        
+        Args:
+            pairs: (image_path, prompt) pairs
+            concurrency: Maximum number of requests in flight
+            **kwargs: Passed through to analyze_image (model, etc.)
+            
+        Returns:
+            List of VisionResult in the same order as pairs
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def one(image_path: Union[str, Path], prompt: str) -> VisionResult:
+            async with sem:
+                return await asyncio.to_thread(self.analyze_image, image_path, prompt, **kwargs)
+        
+        return list(await asyncio.gather(*(one(p, q) for p, q in pairs)))
+    
+    def _encode_image(self, image_path: Union[str, Path]) -> bytes:
+        """Encode image file to a base64 data URL.
+        
+        Returns bytes (base64 is ASCII) so callers can splice it into a request
+        body without an intermediate str copy. Results are cached by path,
+        mtime and size, so analyzing the same image with several prompts only
+        reads and encodes it once; editing the file invalidates the entry.
+        """
+        path = os.path.abspath(image_path)
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        data = _ENCODE_CACHE.get(key)
+        if data is None:
+            data = _encode_file(path, st.st_size)
+            _cache_encoded(key, data)
+        return data
+    
     @classmethod
     @abstractmethod
     def from_env(cls) -> "VisionClient":
         """Create a client instance from environment variables."""
         raise NotImplementedError
+
+
+def _cache_encoded(key: tuple[str, int, int], data: bytes) -> None:
+    """Add an encoding to the cache, evicting the oldest entries to stay in budget."""
+    global _encode_cache_bytes
+    if len(data) > _ENCODE_CACHE_MAX_BYTES:
+        return
+    with _encode_cache_lock:
+        if key in _ENCODE_CACHE:
+            return
+        while _ENCODE_CACHE and _encode_cache_bytes + len(data) > _ENCODE_CACHE_MAX_BYTES:
+            oldest = next(iter(_ENCODE_CACHE))
+            _encode_cache_bytes -= len(_ENCODE_CACHE.pop(oldest))
+        _ENCODE_CACHE[key] = data
+        _encode_cache_bytes += len(data)
+
+
+def _clear_encode_cache() -> None:
+    """Forget all cached image encodings."""
+    global _encode_cache_bytes
+    with _encode_cache_lock:
+        _ENCODE_CACHE.clear()
+        _encode_cache_bytes = 0
+
+
+def _encode_file(path: str, size: int) -> bytes:
+    """Read and base64-encode an image file into a data URL."""
+    ext = os.path.splitext(path)[1].lower().replace(".", "").replace("jpg", "jpeg")
+    prefix = b"data:image/" + ext.encode() + b";base64,"
+    
+    with open(path, "rb") as f:
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return prefix + base64.b64encode(m)
+        return prefix + base64.b64encode(f.read())
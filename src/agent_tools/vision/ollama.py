@@ -1,13 +1,28 @@
 """Ollama Cloud vision client implementation."""
 
-import base64
+import asyncio
 import json
-import urllib.request
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Sequence, Union
+
+import httpx
 
 from agent_tools.vision.base import VisionClient, VisionResult
-from agent_tools.utils.config import get_env, load_dotenv
+from agent_tools.utils.settings import DEFAULT_OLLAMA_HOST, get_settings
+
+# Optional faster JSON codec
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# OpenAI-compatible chat completions endpoint
+_COMPLETIONS_PATH = "/v1/chat/completions"
+
+# Stand-in for the image data URL while the request payload is serialized
+_IMG_PLACEHOLDER = "__AGENT_TOOLS_IMAGE__"
 
 
 class OllamaVisionClient(VisionClient):
@@ -22,11 +37,14 @@ class OllamaVisionClient(VisionClient):
             "Extract all text",
             model="kimi-k2.5:cloud"
         )
+    
+    The client keeps a pooled HTTP connection open across calls; use it as a
+    context manager (or call close()) when analyzing many images.
     """
     
     DEFAULT_MODEL = "kimi-k2.5:cloud"
     
-    def __init__(self, host: str = "http://127.0.0.1:11434", default_model: str | None = None):
+    def __init__(self, host: str = DEFAULT_OLLAMA_HOST, default_model: str | None = None):
         """Initialize with Ollama host.
         
         Args:
@@ -35,22 +53,27 @@ class OllamaVisionClient(VisionClient):
         """
         self.host = host.rstrip("/")
         self.default_model = default_model or self.DEFAULT_MODEL
+        self._http = httpx.Client(
+            base_url=self.host,
+            http2=True,
+            timeout=180,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._http.close()
+    
+    def __enter__(self) -> "OllamaVisionClient":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
     
     @classmethod
     def from_env(cls) -> "OllamaVisionClient":
         """Create client from OLLAMA_HOST environment variable."""
-        load_dotenv()
-        host = get_env("OLLAMA_HOST", default="http://127.0.0.1:11434")
-        return cls(host=host)
-    
-    def _encode_image(self, image_path: Union[str, Path]) -> str:
-        """Encode image file to base64 data URL."""
-        path = Path(image_path)
-        with open(path, "rb") as f:
-            img_b64 = base64.b64encode(f.read()).decode("utf-8")
-        
-        ext = path.suffix.lower().replace(".", "").replace("jpg", "jpeg")
-        return f"data:image/{ext};base64,{img_b64}"
+        return cls(host=get_settings().ollama_host)
     
     def analyze_image(
         self,
@@ -58,55 +81,217 @@ class OllamaVisionClient(VisionClient):
         prompt: str,
         model: str | None = None,
         timeout: int = 180,
+        on_token: Callable[[str], None] | None = None,
     ) -> VisionResult:
         """Analyze an image using Ollama Cloud.
         
+        The response is streamed; servers that ignore streaming and reply
+        with a single JSON document are handled as well.
+        
         Args:
             image_path: Path to image file
             prompt: Analysis prompt/instruction
             model: Ollama model to use (default: kimi-k2.5:cloud)
             timeout: Request timeout in seconds
+            on_token: Optional callback invoked with each content chunk as it arrives
             
         Returns:
             VisionResult with description and metadata
         """
         model = model or self.default_model
-        data_url = self._encode_image(image_path)
+        body = self._build_body(image_path, prompt, model, stream=True)
         
-        # OpenAI-compatible chat completions endpoint
-        url = f"{self.host}/v1/chat/completions"
+        try:
+            with self._http.stream(
+                "POST",
+                _COMPLETIONS_PATH,
+                content=body,
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            ) as resp:
+                return self._read_stream(resp, model, on_token)
+        except Exception as e:
+            raise _api_error(e)
+    
+    async def analyze_images_batch(
+        self,
+        pairs: Sequence[tuple[Union[str, Path], str]],
+        concurrency: int = 8,
+        model: str | None = None,
+        timeout: int = 180,
+        **kwargs: Any,
+    ) -> list[VisionResult]:
+        """Analyze several images concurrently over one async HTTP client.
         
-        payload = {
+        Args:
+            pairs: (image_path, prompt) pairs
+            concurrency: Maximum number of requests in flight
+            model: Ollama model to use (default: kimi-k2.5:cloud)
+            timeout: Request timeout in seconds
+            **kwargs: Accepted for VisionClient compatibility; any option
+                other than the above raises TypeError
+            
+        Returns:
+            List of VisionResult in the same order as pairs
+            
+        Raises:
+            TypeError: If unsupported options are passed
+        """
+        if kwargs:
+            raise TypeError(
+                f"OllamaVisionClient.analyze_images_batch() got unsupported options: "
+                f"{', '.join(sorted(kwargs))}"
+            )
+        model = model or self.default_model
+        sem = asyncio.Semaphore(concurrency)
+        
+        async with self._async_client(concurrency, timeout) as client:
+            async def one(image_path: Union[str, Path], prompt: str) -> VisionResult:
+                async with sem:
+                    body = await asyncio.to_thread(self._build_body, image_path, prompt, model)
+                    try:
+                        resp = await client.post(
+                            _COMPLETIONS_PATH,
+                            content=body,
+                            headers={"Content-Type": "application/json"},
+                        )
+                        return self._to_result(resp, model)
+                    except Exception as e:
+                        raise _api_error(e)
+            
+            return list(await asyncio.gather(*(one(p, q) for p, q in pairs)))
+    
+    def _async_client(self, concurrency: int, timeout: int) -> httpx.AsyncClient:
+        """Create the async HTTP client used by analyze_images_batch."""
+        return httpx.AsyncClient(
+            base_url=self.host,
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+    
+    def _build_body(
+        self, image_path: Union[str, Path], prompt: str, model: str, stream: bool = False
+    ) -> bytes:
+        """Build the JSON request body for a chat completion with one image."""
+        data_url = self._encode_image(image_path)
+        
+        payload: dict[str, Any] = {
             "model": model,
             "messages": [
                 {
                     "role": "user",
                     "content": [
                         {"type": "text", "text": prompt},
-                        {"type": "image_url", "image_url": {"url": data_url}},
+                        {"type": "image_url", "image_url": {"url": _IMG_PLACEHOLDER}},
                     ],
                 }
             ],
         }
+        if stream:
+            payload["stream"] = True
+            # Streams only report token usage (in a final frame) when asked
+            payload["stream_options"] = {"include_usage": True}
         
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode(),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        # Serialize the small payload, then splice in the (large) image bytes
+        # so the base64 data never round-trips through a Python str. The image
+        # part serializes after the prompt, so split on the last occurrence.
+        body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        head, _, tail = body.rpartition(b'"' + _IMG_PLACEHOLDER.encode() + b'"')
+        return b"".join((head, b'"', data_url, b'"', tail))
+    
+    @classmethod
+    def _read_stream(
+        cls,
+        resp: httpx.Response,
+        model: str,
+        on_token: Callable[[str], None] | None,
+    ) -> VisionResult:
+        """Assemble a VisionResult from a streamed chat completions response.
         
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                data = json.loads(resp.read())
-                content = data["choices"][0]["message"]["content"]
-                
-                return VisionResult(
-                    description=content,
-                    raw_response=data,
-                    model=model,
-                )
-        except urllib.error.HTTPError as e:
-            raise RuntimeError(f"Ollama API error: {e.code} - {e.read().decode()}")
-        except Exception as e:
-            raise RuntimeError(f"Failed to analyze image: {e}")
+        Server-sent `data:` frames are decoded one at a time and their
+        delta content joined. A plain JSON response (streaming unsupported)
+        is passed to _to_result unchanged.
+        
+        Raises:
+            RuntimeError: If the server reports an error mid-stream, or the
+                stream ends before the completion does
+        """
+        if resp.is_error or resp.headers.get("content-type", "").startswith("application/json"):
+            resp.read()
+            return cls._to_result(resp, model)
+        
+        pieces = []
+        last: dict[str, Any] = {}
+        finish_reason = None
+        usage = None
+        done = False
+        seen_choices = False
+        for line in resp.iter_lines():
+            if line.startswith("data:"):
+                frame = line[5:].strip()
+            elif line.startswith("{"):
+                # Bare JSON, e.g. an error written after the headers went out
+                frame = line
+            else:
+                continue
+            if frame == "[DONE]":
+                done = True
+                break
+            last = _json_loads(frame)
+            if "error" in last:
+                raise _StreamError(f"Ollama API error: {last['error']}")
+            usage = last.get("usage") or usage
+            choices = last.get("choices")
+            if not choices:
+                continue
+            seen_choices = True
+            finish_reason = choices[0].get("finish_reason") or finish_reason
+            piece = choices[0].get("delta", {}).get("content")
+            if piece:
+                pieces.append(piece)
+                if on_token is not None:
+                    on_token(piece)
+        
+        if not seen_choices or not (done or finish_reason):
+            raise _StreamError("Ollama API error: stream ended before the completion finished")
+        
+        content = "".join(pieces)
+        # Shape raw_response like a non-streamed completion
+        data = dict(last)
+        if usage is not None:
+            data["usage"] = usage
+        data["choices"] = [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }
+        ]
+        return VisionResult(description=content, raw_response=data, model=model)
+    
+    @staticmethod
+    def _to_result(resp: httpx.Response, model: str) -> VisionResult:
+        """Convert a chat completions response into a VisionResult."""
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
+        content = data["choices"][0]["message"]["content"]
+        
+        return VisionResult(
+            description=content,
+            raw_response=data,
+            model=model,
+        )
+
+
+class _StreamError(RuntimeError):
+    """Error reported inside a streamed response; raised as-is by analyze_image."""
+
+
+def _api_error(e: Exception) -> RuntimeError:
+    """Wrap a request failure in the RuntimeError analyze_image raises."""
+    if isinstance(e, _StreamError):
+        return e
+    if isinstance(e, httpx.HTTPStatusError):
+        return RuntimeError(f"Ollama API error: {e.response.status_code} - {e.response.text}")
+    return RuntimeError(f"Failed to analyze image: {e}")
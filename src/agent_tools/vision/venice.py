@@ -1,13 +1,12 @@
 """Venice AI vision client implementation."""
 
-import base64
 from pathlib import Path
 from typing import Union
 
 from venice_ai import VeniceClient
 
 from agent_tools.vision.base import VisionClient, VisionResult
-from agent_tools.utils.config import get_env, load_dotenv
+from agent_tools.utils.settings import get_settings
 
 
 class VeniceVisionClient(VisionClient):
@@ -38,19 +37,11 @@ class VeniceVisionClient(VisionClient):
     @classmethod
     def from_env(cls) -> "VeniceVisionClient":
         """Create client from VENICE_API_KEY environment variable."""
-        load_dotenv()
-        api_key = get_env("VENICE_API_KEY", required=True)
+        api_key = get_settings().venice_api_key
+        if api_key is None:
+            raise ValueError("Required environment variable VENICE_API_KEY is not set")
         return cls(api_key=api_key)
     
-    def _encode_image(self, image_path: Union[str, Path]) -> str:
-        """Encode image file to base64 data URL."""
-        path = Path(image_path)
-        with open(path, "rb") as f:
-            img_b64 = base64.b64encode(f.read()).decode("utf-8")
-        
-        ext = path.suffix.lower().replace(".", "").replace("jpg", "jpeg")
-        return f"data:image/{ext};base64,{img_b64}"
-    
     def analyze_image(
         self,
         image_path: Union[str, Path],
@@ -70,7 +61,8 @@ class VeniceVisionClient(VisionClient):
             VisionResult with description and metadata
         """
         model = model or self.default_model
-        data_url = self._encode_image(image_path)
+        # The SDK needs a str URL; base64 is ASCII so this is a plain copy
+        data_url = self._encode_image(image_path).decode("ascii")
         
         messages = [
             {
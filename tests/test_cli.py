@@ -0,0 +1,17 @@
+"""Tests for the agent-tools CLI."""
+
+import contextlib
+import io
+import json
+
+from agent_tools import cli
+
+
+def test_list_json_without_binary_stdout():
+    """Test that list_json works when stdout has no binary buffer."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        cli.list_json()
+
+    tools = json.loads(out.getvalue())
+    assert "vision.ollama" in [t["name"] for t in tools]
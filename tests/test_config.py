@@ -0,0 +1,87 @@
+"""Tests for configuration utilities."""
+
+import os
+
+import pytest
+
+from agent_tools.utils import config
+from agent_tools.utils.config import load_dotenv
+
+
+@pytest.fixture
+def environ(monkeypatch):
+    """Give each test an isolated os.environ."""
+    env = {}
+    monkeypatch.setattr(config.os, "environ", env)
+    config._dotenv_cache_clear()
+    return env
+
+
+def _loaded(env):
+    # pytest records PYTEST_CURRENT_TEST in whatever os.environ currently is
+    return {k: v for k, v in env.items() if k != "PYTEST_CURRENT_TEST"}
+
+
+def test_load_dotenv_parses_assignments(tmp_path, environ):
+    """Test quoting, comments, and first-assignment-wins parsing."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# comment\n"
+        "VENICE_API_KEY = \"abc#123\"\n"
+        "  OLLAMA_HOST=http://127.0.0.1:11434\r\n"
+        "EMPTY=\n"
+        "VENICE_API_KEY=ignored\n"
+    )
+    environ["PRESET"] = "keep"
+    env_file.write_text(env_file.read_text() + "PRESET=override\n")
+
+    load_dotenv(env_file)
+
+    assert _loaded(environ) == {
+        "VENICE_API_KEY": "abc#123",
+        "OLLAMA_HOST": "http://127.0.0.1:11434",
+        "EMPTY": "",
+        "PRESET": "keep",
+    }
+
+
+def test_load_dotenv_reparses_only_on_change(tmp_path, environ):
+    """Test that parsed contents are cached by path and mtime."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("A=1\n")
+    load_dotenv(env_file)
+    load_dotenv(env_file)
+    assert len(config._DOTENV_CACHE) == 1
+
+    env_file.write_text("A=1\nB=2\n")
+    os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1_000_000))
+    load_dotenv(env_file)
+    assert _loaded(environ) == {"A": "1", "B": "2"}
+
+
+def test_load_dotenv_missing_file(tmp_path, environ):
+    """Test that a missing file is ignored."""
+    load_dotenv(tmp_path / "missing.env")
+    assert _loaded(environ) == {}
+
+
+def test_load_dotenv_caches_discovered_path(tmp_path, environ, monkeypatch):
+    """Test that the upward .env search runs once per working directory."""
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (tmp_path / ".env").write_text("FOUND=yes\n")
+    monkeypatch.chdir(nested)
+
+    load_dotenv()
+    assert _loaded(environ) == {"FOUND": "yes"}
+    assert config._DOTENV_PATH_CACHE == {str(nested): tmp_path / ".env"}
+
+    (nested / ".env").write_text("FOUND=nearer\n")
+    environ.clear()
+    load_dotenv()
+    assert _loaded(environ) == {"FOUND": "yes"}
+
+    config._dotenv_cache_clear()
+    load_dotenv()
+    assert _loaded(environ) == {"FOUND": "yes"}  # already set, not overridden
+    assert config._DOTENV_PATH_CACHE == {str(nested): nested / ".env"}
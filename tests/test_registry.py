@@ -0,0 +1,89 @@
+"""Tests for the tool registry."""
+
+import os
+
+import pytest
+
+from agent_tools import registry
+from agent_tools.registry import (
+    ToolInfo,
+    _invalidate_env_cache,
+    discover,
+    get_tool,
+    get_tool_info,
+)
+
+
+def test_get_tool_caches_class():
+    """Test that the tool class is resolved once and reused."""
+    info = get_tool_info("vision.ollama")
+    cls = get_tool("vision.ollama")
+    assert cls.__name__ == "OllamaVisionClient"
+    assert info._cls_cache is cls
+    assert get_tool("vision.ollama") is cls
+
+
+def test_get_tool_unknown():
+    """Test that unknown tool names raise KeyError."""
+    with pytest.raises(KeyError):
+        get_tool("vision.unknown")
+
+
+def test_discover_reflects_env_after_invalidate(monkeypatch):
+    """Test that availability is cached until the env cache is cleared."""
+    monkeypatch.delenv("VENICE_API_KEY", raising=False)
+    _invalidate_env_cache()
+    before = discover()
+    assert before["total"] == len(before["tools"])
+
+    monkeypatch.setenv("VENICE_API_KEY", "test-key")
+    assert discover()["available"] == before["available"]
+
+    _invalidate_env_cache()
+    info = discover()
+    assert info["available"] == before["available"] + 1
+    assert any(t["name"] == "vision.venice" and t["available"] for t in info["tools"])
+    _invalidate_env_cache()
+
+
+def test_discover_reflects_load_dotenv(tmp_path, monkeypatch):
+    """Test that variables set by load_dotenv() invalidate cached availability."""
+    from agent_tools.utils import config
+
+    monkeypatch.setenv("VENICE_API_KEY", "placeholder")
+    monkeypatch.delenv("VENICE_API_KEY")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("VENICE_API_KEY=from-dotenv\n")
+    config._dotenv_cache_clear()
+    _invalidate_env_cache()
+    try:
+        before = discover()["available"]
+        config.load_dotenv()
+        assert discover()["available"] == before + 1
+    finally:
+        os.environ.pop("VENICE_API_KEY", None)
+        config._dotenv_cache_clear()
+        _invalidate_env_cache()
+
+
+def test_discover_cache_tracks_registry_changes(monkeypatch):
+    """Test that discover() is cached but refreshed when the registry is rebuilt."""
+    assert discover() is discover()
+
+    extra = ToolInfo(
+        name="test.dummy",
+        description="Dummy tool",
+        module_path="agent_tools.registry",
+        class_name="ToolInfo",
+        env_vars=[],
+        is_available=lambda: True,
+    )
+    monkeypatch.setattr(registry, "_REGISTRY", registry._REGISTRY + [extra])
+    registry._rebuild_index()
+    try:
+        assert "test.dummy" in [t["name"] for t in discover()["tools"]]
+        assert get_tool("test.dummy") is ToolInfo
+    finally:
+        monkeypatch.undo()
+        registry._rebuild_index()
+    assert "test.dummy" not in [t["name"] for t in discover()["tools"]]
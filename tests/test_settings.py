@@ -0,0 +1,56 @@
+"""Tests for environment-backed settings."""
+
+import pytest
+
+from agent_tools.utils import config
+from agent_tools.utils.settings import DEFAULT_OLLAMA_HOST, Settings, get_settings
+from agent_tools.vision.ollama import OllamaVisionClient
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings(tmp_path, monkeypatch):
+    """Run without a .env file and with an empty settings cache."""
+    monkeypatch.chdir(tmp_path)
+    config._dotenv_cache_clear()
+    get_settings.cache_clear()
+    yield
+    config._dotenv_cache_clear()
+    get_settings.cache_clear()
+
+
+def test_settings_defaults(monkeypatch):
+    """Test defaults when no provider variables are set."""
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    monkeypatch.delenv("VENICE_API_KEY", raising=False)
+    assert get_settings() == Settings(ollama_host=DEFAULT_OLLAMA_HOST, venice_api_key=None)
+
+
+def test_settings_read_once(monkeypatch):
+    """Test that settings are cached until cache_clear()."""
+    monkeypatch.setenv("OLLAMA_HOST", "http://first:11434")
+    assert get_settings().ollama_host == "http://first:11434"
+
+    monkeypatch.setenv("OLLAMA_HOST", "http://second:11434")
+    assert get_settings() is get_settings()
+    assert get_settings().ollama_host == "http://first:11434"
+
+    get_settings.cache_clear()
+    assert get_settings().ollama_host == "http://second:11434"
+
+
+def test_settings_load_dotenv(tmp_path, monkeypatch):
+    """Test that .env values are visible on first use."""
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    (tmp_path / ".env").write_text("OLLAMA_HOST=http://dotenv:11434\n")
+    try:
+        with OllamaVisionClient.from_env() as client:
+            assert client.host == "http://dotenv:11434"
+    finally:
+        monkeypatch.delenv("OLLAMA_HOST", raising=False)
+
+
+def test_get_env_deprecated(monkeypatch):
+    """Test that get_env still works but warns."""
+    monkeypatch.setenv("OLLAMA_HOST", "http://x")
+    with pytest.deprecated_call():
+        assert config.get_env("OLLAMA_HOST") == "http://x"
@@ -0,0 +1,456 @@
+"""Tests for the sub-agent health monitor."""
+
+import json
+import socket
+import struct
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from agent_tools import subagent_monitor
+
+
+@pytest.fixture(autouse=True)
+def _isolate_monitor(monkeypatch, tmp_path):
+    """Reset monitor caches and disable bulk/daemon openclaw paths unless a test opts in."""
+    monkeypatch.setattr(subagent_monitor, "_history_bulk_supported", False)
+    monkeypatch.setattr(subagent_monitor, "_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    monkeypatch.setattr(subagent_monitor, "_conn", None)
+    subagent_monitor._clear_history_cache()
+
+
+def _session(key, updated_at, **extra):
+    session = {
+        "key": key,
+        "kind": "isolated",
+        "updatedAt": updated_at,
+        "totalTokens": 100,
+        "systemSent": True,
+        "sessionId": "abcdef123456",
+    }
+    session.update(extra)
+    return session
+
+
+def _fake_run(stdout, returncode=0):
+    def run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr=b"")
+    return run
+
+
+def test_get_sessions_parses_json(monkeypatch):
+    """Test parsing the JSON document emitted by `openclaw sessions list`."""
+    stdout = b'{"sessions": [{"key": "a", "kind": "isolated"}, {"key": "b", "kind": "group"}]}'
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", _fake_run(stdout))
+
+    assert [s["key"] for s in subagent_monitor.get_sessions()] == ["a", "b"]
+    assert [s["key"] for s in subagent_monitor.get_sessions(subagents_only=True)] == ["a"]
+
+
+def test_get_sessions_parses_ndjson_fallback(monkeypatch):
+    """Test the newline-delimited fallback when stdout is not a single document."""
+    stdout = b'{"key": "a", "kind": "isolated"}\n{"key": "b", "kind": "group"}\n'
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", _fake_run(stdout))
+
+    assert [s["key"] for s in subagent_monitor.get_sessions()] == ["a", "b"]
+    assert [s["key"] for s in subagent_monitor.get_sessions(channels_only=True)] == ["b"]
+
+
+def test_format_timestamp_matches_local_time():
+    """Test that the integer-math formatter agrees with datetime in local time."""
+    for ts_ms in (0, 1_700_000_000_123, 1_711_846_799_999, 1_711_846_800_000):
+        expected = datetime.fromtimestamp(ts_ms // 1000).strftime("%H:%M:%S")
+        assert subagent_monitor.format_timestamp(ts_ms) == expected
+
+
+def test_display_name():
+    """Test display names derived from session keys."""
+    display = subagent_monitor._display_name
+    assert display("agent:main:discord:channel:" + "9" * 40) == "9" * 35
+    assert display("a:discord:channel:x:discord:channel:y") == "y"
+    assert display("agent:main:cron:nightly-report") == "cron:nightly-report"
+    assert display("agent:main:main") == "main"
+    assert display("agent:isolated:" + "x" * 50) == ("agent:isolated:" + "x" * 50)[:40]
+
+
+def test_check_health_statuses():
+    """Test status classification against a fixed report time."""
+    now_ms = 1_700_000_000_000
+    healthy = subagent_monitor.check_health(_session("agent:main", now_ms - 60_000), now_ms=now_ms)
+    assert healthy["status"] == "healthy"
+    assert healthy["idle_min"] == 1
+    assert healthy["display"] == "main"
+
+    stuck = subagent_monitor.check_health(_session("agent:x", now_ms - 15 * 60_000), now_ms=now_ms)
+    assert stuck["status"] == "suspect"
+    assert "STUCK >10min" in stuck["issues"]
+
+    crashed = subagent_monitor.check_health(
+        _session("agent:x", now_ms, abortedLastRun=True), now_ms=now_ms
+    )
+    assert crashed["status"] == "crashed"
+
+    stalled = subagent_monitor.check_health(
+        _session("agent:x", now_ms, systemSent=False, totalTokens=None), now_ms=now_ms
+    )
+    assert stalled["status"] == "stalled"
+
+    # Positional stuck_threshold, clock read when now_ms is omitted
+    recent = _session("agent:x", int(time.time() * 1000) - 15 * 60_000)
+    assert subagent_monitor.check_health(recent, 30)["status"] == "healthy"
+    assert subagent_monitor.check_health(recent, 10)["status"] == "suspect"
+
+
+def test_get_sessions_ndjson_skips_malformed_lines(monkeypatch):
+    """Test that one bad NDJSON line doesn't discard the others."""
+    stdout = b'{"key": "a"}\n\n{"key": \n{"key": "b"}\n'
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", _fake_run(stdout))
+
+    assert [s["key"] for s in subagent_monitor.get_sessions()] == ["a", "b"]
+
+
+def test_print_report_details_fetches_each_history(monkeypatch, capsys):
+    """Test that --details fetches history for every session, in report order."""
+    now_ms = int(time.time() * 1000)
+    sessions = [_session(f"agent:{i}", now_ms - i * 1000) for i in range(5)]
+    fetched = []
+
+    def fake_history(key, limit=5):
+        fetched.append(key)
+        return [{"role": "user", "content": f"task for {key}"}]
+
+    monkeypatch.setattr(subagent_monitor, "get_session_history", fake_history)
+    subagent_monitor.print_report(sessions, show_details=True)
+
+    out = capsys.readouterr().out
+    assert sorted(fetched) == sorted(s["key"] for s in sessions)
+    rows = [line for line in out.splitlines() if "task for" in line]
+    assert [row.split("task for ")[1].strip() for row in rows] == [
+        f"agent:{i}" for i in range(5)
+    ]
+
+
+def test_print_report_reuses_history_for_unchanged_sessions(monkeypatch, capsys):
+    """Test that history is only re-fetched when a session's updatedAt changes."""
+    now_ms = int(time.time() * 1000)
+    sessions = [_session("agent:a", now_ms), _session("agent:b", now_ms - 1000)]
+    fetched = []
+
+    def fake_history(key, limit=5):
+        fetched.append(key)
+        return []
+
+    monkeypatch.setattr(subagent_monitor, "get_session_history", fake_history)
+    subagent_monitor.print_report(sessions, show_details=True)
+    subagent_monitor.print_report(sessions, show_details=True)
+    assert sorted(fetched) == ["agent:a", "agent:b"]
+
+    sessions[0]["updatedAt"] += 1
+    subagent_monitor.print_report(sessions, show_details=True)
+    assert sorted(fetched) == ["agent:a", "agent:a", "agent:b"]
+
+
+def test_print_report_retries_failed_history(monkeypatch, capsys):
+    """Test that a failed history fetch isn't cached for the unchanged session."""
+    now_ms = int(time.time() * 1000)
+    sessions = [_session("agent:a", now_ms)]
+    replies = [None, [{"role": "user", "content": "recovered task"}]]
+    fetched = []
+
+    def fake_history(key, limit=5):
+        fetched.append(key)
+        return replies[len(fetched) - 1]
+
+    monkeypatch.setattr(subagent_monitor, "get_session_history", fake_history)
+    subagent_monitor.print_report(sessions, show_details=True)
+    subagent_monitor.print_report(sessions, show_details=True)
+    subagent_monitor.print_report(sessions, show_details=True)
+
+    assert fetched == ["agent:a", "agent:a"]
+    assert "recovered task" in capsys.readouterr().out
+
+
+def test_get_sessions_with_history_falls_back(monkeypatch):
+    """Test fallback to a plain listing when openclaw rejects --with-history."""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        if "--with-history" in cmd:
+            return subprocess.CompletedProcess(cmd, 1, stdout=b"", stderr=b"unknown option")
+        stdout = b'{"sessions": [{"key": "a"}]}'
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", run)
+    monkeypatch.setattr(subagent_monitor, "_with_history_supported", True)
+
+    assert subagent_monitor.get_sessions_with_history() == [{"key": "a"}]
+    assert subagent_monitor.get_sessions_with_history() == [{"key": "a"}]
+    # The unsupported flag is only tried once
+    assert sum("--with-history" in cmd for cmd in calls) == 1
+
+
+def test_get_sessions_with_history_retries_after_transient_error(monkeypatch, capsys):
+    """Test that a non-usage failure doesn't disable --with-history."""
+    results = [
+        (1, b"", b"gateway unreachable"),
+        (0, b'{"sessions": [{"key": "a", "history": []}]}', b""),
+    ]
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        returncode, stdout, stderr = results[len(calls) - 1]
+        return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr=stderr)
+
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", run)
+    monkeypatch.setattr(subagent_monitor, "_with_history_supported", True)
+
+    assert subagent_monitor.get_sessions_with_history() == []
+    assert "gateway unreachable" in capsys.readouterr().err
+    assert subagent_monitor.get_sessions_with_history() == [{"key": "a", "history": []}]
+    assert all("--with-history" in cmd for cmd in calls)
+    assert subagent_monitor._with_history_supported
+
+
+def test_print_report_uses_attached_history(monkeypatch, capsys):
+    """Test that batched history skips the per-session history call."""
+    now_ms = int(time.time() * 1000)
+    history = [{"role": "user", "content": "batched task"}]
+    sessions = [_session("agent:a", now_ms, history=history), _session("agent:b", now_ms)]
+    fetched = []
+
+    def fake_history(key, limit=5):
+        fetched.append(key)
+        return [{"role": "user", "content": "fetched task"}]
+
+    monkeypatch.setattr(subagent_monitor, "get_session_history", fake_history)
+    subagent_monitor.print_report(sessions, show_details=True)
+
+    out = capsys.readouterr().out
+    assert fetched == ["agent:b"]
+    assert "batched task" in out and "fetched task" in out
+
+
+def test_print_report_uses_bulk_history(monkeypatch, capsys):
+    """Test that one bulk call replaces per-session history calls."""
+    now_ms = int(time.time() * 1000)
+    sessions = [_session("agent:a", now_ms), _session("agent:b", now_ms - 1000)]
+    stdout = (
+        b'{"histories": {"agent:a": [{"role": "user", "content": "task a"}],'
+        b' "agent:b": [{"role": "user", "content": "task b"}]}}'
+    )
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", run)
+    monkeypatch.setattr(subagent_monitor, "_history_bulk_supported", True)
+    subagent_monitor.print_report(sessions, show_details=True)
+
+    out = capsys.readouterr().out
+    assert len(calls) == 1 and "history-bulk" in calls[0]
+    assert "task a" in out and "task b" in out
+
+
+@pytest.mark.parametrize(
+    "returncode, stderr, still_supported",
+    [
+        (1, b"error: unknown command 'history-bulk'", False),
+        (2, b"usage: openclaw sessions ...", False),
+        (1, b"gateway unreachable", True),
+    ],
+)
+def test_get_session_histories_failure(monkeypatch, returncode, stderr, still_supported):
+    """Test that only an unknown-subcommand failure disables bulk history."""
+    def run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, returncode, stdout=b"", stderr=stderr)
+
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", run)
+    monkeypatch.setattr(subagent_monitor, "_history_bulk_supported", True)
+
+    assert subagent_monitor.get_session_histories(["agent:a"]) is None
+    assert subagent_monitor._history_bulk_supported is still_supported
+
+
+def test_print_report_bulk_history_uses_cache_and_falls_back(monkeypatch, capsys):
+    """Test that bulk history skips cached sessions and refetches keys it omits."""
+    now_ms = int(time.time() * 1000)
+    sessions = [_session("agent:a", now_ms), _session("agent:b", now_ms - 1000)]
+    bulk_calls = []
+    fetched = []
+
+    def run(cmd, **kwargs):
+        bulk_calls.append(cmd[cmd.index("--keys") + 1])
+        stdout = b'{"histories": {"agent:a": [{"role": "user", "content": "task a"}]}}'
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+    def fake_history(key, limit=5):
+        fetched.append(key)
+        return [{"role": "user", "content": f"fetched {key}"}]
+
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", run)
+    monkeypatch.setattr(subagent_monitor, "get_session_history", fake_history)
+    monkeypatch.setattr(subagent_monitor, "_history_bulk_supported", True)
+
+    subagent_monitor.print_report(sessions, show_details=True)
+    out = capsys.readouterr().out
+    assert bulk_calls == ["agent:a,agent:b"]
+    assert fetched == ["agent:b"]
+    assert "task a" in out and "fetched agent:b" in out
+
+    # Unchanged sessions come from the cache; only the updated one is re-fetched
+    subagent_monitor.print_report(sessions, show_details=True)
+    assert bulk_calls == ["agent:a,agent:b"]
+    sessions[1]["updatedAt"] += 1
+    subagent_monitor.print_report(sessions, show_details=True)
+    assert bulk_calls == ["agent:a,agent:b", "agent:b"]
+
+
+def test_get_sessions_reuses_daemon_connection(monkeypatch, tmp_path):
+    """Test that get_sessions talks to the daemon socket and keeps the connection."""
+    path = str(tmp_path / "openclaw.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    requests = []
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            for _ in range(2):
+                (length,) = struct.unpack(">I", conn.recv(4))
+                requests.append(json.loads(conn.recv(length)))
+                reply = json.dumps({"sessions": [{"key": "a", "kind": "isolated"}]}).encode()
+                conn.sendall(struct.pack(">I", len(reply)) + reply)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    monkeypatch.setattr(subagent_monitor, "_DAEMON_SOCKET", path)
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", None)  # must not fork
+
+    try:
+        for _ in range(2):
+            assert subagent_monitor.get_sessions(subagents_only=True) == [
+                {"key": "a", "kind": "isolated"}
+            ]
+        thread.join(timeout=5)
+        assert requests == [
+            {"cmd": "sessions.list", "activeMinutes": 60, "kinds": ["isolated"]}
+        ] * 2
+    finally:
+        if subagent_monitor._conn is not None:
+            subagent_monitor._conn.close()
+        server.close()
+
+
+def test_get_sessions_falls_back_on_daemon_error(monkeypatch):
+    """Test that a daemon reply without sessions falls through to the CLI."""
+    monkeypatch.setattr(
+        subagent_monitor, "_daemon_request", lambda request: {"error": "not ready"}
+    )
+    stdout = b'{"sessions": [{"key": "a", "kind": "isolated"}]}'
+    monkeypatch.setattr(subagent_monitor.subprocess, "run", _fake_run(stdout))
+
+    assert subagent_monitor.get_sessions() == [{"key": "a", "kind": "isolated"}]
+
+
+def test_watch_mode_prefetches_during_interval(monkeypatch, capsys):
+    """Test that the next listing is fetched before the interval ends."""
+    fetched = threading.Event()
+    calls = []
+    sleeps = []
+
+    def fake_get_sessions(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            fetched.set()
+        return []
+
+    def fake_sleep(secs):
+        sleeps.append(secs)
+        if len(sleeps) == 2:
+            # The second fetch must already be running while we wait
+            assert fetched.wait(timeout=5)
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(subagent_monitor, "get_sessions", fake_get_sessions)
+    monkeypatch.setattr(subagent_monitor.time, "sleep", fake_sleep)
+
+    with pytest.raises(SystemExit):
+        subagent_monitor.watch_mode()
+
+    assert len(calls) == 2
+    assert sum(sleeps) == pytest.approx(subagent_monitor._WATCH_INTERVAL)
+    assert "Exiting watch mode" in capsys.readouterr().out
+
+
+def test_print_report_checks_health_once_per_session(monkeypatch, capsys):
+    """Test that each session is classified once per report, including in details mode."""
+    now_ms = int(time.time() * 1000)
+    history = [{"role": "user", "content": "task"}]
+    sessions = [_session(f"agent:{i}", now_ms - i * 1000, history=history) for i in range(3)]
+    checked = []
+    real_check_health = subagent_monitor.check_health
+
+    def counting_check_health(session, *args, **kwargs):
+        checked.append(session["key"])
+        return real_check_health(session, *args, **kwargs)
+
+    monkeypatch.setattr(subagent_monitor, "check_health", counting_check_health)
+    for show_details in (False, True):
+        checked.clear()
+        subagent_monitor.print_report(sessions, show_details=show_details)
+        assert sorted(checked) == ["agent:0", "agent:1", "agent:2"]
+
+
+def test_print_report_handles_missing_updated_at(capsys):
+    """Test that sessions without updatedAt sort last instead of raising."""
+    now_ms = int(time.time() * 1000)
+    sessions = [{"key": "agent:old"}, _session("agent:new", now_ms)]
+    subagent_monitor.print_report(sessions)
+
+    assert [s["key"] for s in sessions] == ["agent:new", "agent:old"]
+    assert "updatedAt" not in sessions[1]
+
+
+def test_watch_mode_exit_does_not_wait_for_fetch(monkeypatch, capsys):
+    """Test that Ctrl+C with a fetch in flight exits without joining the fetch thread."""
+    release = threading.Event()
+    in_flight = threading.Event()
+    fetch_threads = []
+
+    def fake_get_sessions(**kwargs):
+        fetch_threads.append(threading.current_thread())
+        if len(fetch_threads) == 2:
+            in_flight.set()
+            release.wait(timeout=10)  # a slow openclaw call
+        return []
+
+    sleeps = []
+
+    def fake_sleep(secs):
+        sleeps.append(secs)
+        if len(sleeps) == 2:
+            # Ctrl+C while the second fetch is still running
+            assert in_flight.wait(timeout=5)
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(subagent_monitor, "get_sessions", fake_get_sessions)
+    monkeypatch.setattr(subagent_monitor.time, "sleep", fake_sleep)
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(SystemExit):
+            subagent_monitor.watch_mode()
+        assert time.monotonic() - started < 5
+        assert in_flight.is_set() and fetch_threads[1].is_alive()
+        # Daemon threads aren't joined at interpreter exit
+        assert all(t.daemon for t in fetch_threads)
+    finally:
+        release.set()
@@ -1,9 +1,15 @@
 """Tests for vision base classes."""
 
+import asyncio
+import base64
+import dataclasses
+import threading
+import time
+
 import pytest
 from pathlib import Path
 
-from agent_tools.vision.base import VisionResult
+from agent_tools.vision.base import VisionClient, VisionResult
 
 
 def test_vision_result_str():
@@ -33,3 +39,100 @@ def test_import_vision_clients():
     assert VisionResult is not None
     assert VeniceVisionClient is not None
     assert OllamaVisionClient is not None
+
+
+def test_encode_image_data_url(tmp_path):
+    """Test that images are encoded to a base64 data URL as bytes."""
+    from agent_tools.vision.ollama import OllamaVisionClient
+
+    image = tmp_path / "shot.JPG"
+    image.write_bytes(b"\xff\xd8\xff fake jpeg")
+    data_url = OllamaVisionClient()._encode_image(image)
+    assert data_url == b"data:image/jpeg;base64," + base64.b64encode(image.read_bytes())
+
+
+def test_analyze_images_batch_default_bounds_concurrency():
+    """Test the thread-based default batch: ordered results, bounded concurrency."""
+    class SlowClient(VisionClient):
+        def __init__(self):
+            self.active = 0
+            self.peak = 0
+            self.lock = threading.Lock()
+
+        def analyze_image(self, image_path, prompt, **kwargs):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.02)
+            with self.lock:
+                self.active -= 1
+            return VisionResult(description=f"{image_path}:{prompt}", model=kwargs.get("model"))
+
+        @classmethod
+        def from_env(cls):
+            return cls()
+
+    client = SlowClient()
+    pairs = [(f"img{i}.png", "describe") for i in range(6)]
+    results = asyncio.run(client.analyze_images_batch(pairs, concurrency=2, model="m"))
+
+    assert [r.description for r in results] == [f"img{i}.png:describe" for i in range(6)]
+    assert all(r.model == "m" for r in results)
+    assert client.peak == 2
+
+
+def test_encode_image_cache_invalidated_on_change(tmp_path):
+    """Test that encoded images are cached until the file changes."""
+    from agent_tools.vision import base
+    from agent_tools.vision.ollama import OllamaVisionClient
+
+    base._clear_encode_cache()
+    client = OllamaVisionClient()
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"first")
+
+    first = client._encode_image(image)
+    assert client._encode_image(str(image)) is first
+    assert len(base._ENCODE_CACHE) == 1
+
+    image.write_bytes(b"second version")
+    assert client._encode_image(image).endswith(base64.b64encode(b"second version"))
+    client.close()
+
+
+def test_encode_image_cache_bounded_by_bytes(tmp_path, monkeypatch):
+    """Test that the encode cache evicts oldest entries to stay within its byte budget."""
+    from agent_tools.vision import base
+    from agent_tools.vision.ollama import OllamaVisionClient
+
+    base._clear_encode_cache()
+    images = []
+    for i in range(3):
+        image = tmp_path / f"shot{i}.png"
+        image.write_bytes(b"x" * 60)
+        images.append(str(image))
+    client = OllamaVisionClient()
+    entry_size = len(client._encode_image(images[0]))
+    monkeypatch.setattr(base, "_ENCODE_CACHE_MAX_BYTES", entry_size * 2)
+
+    for image in images[1:]:
+        client._encode_image(image)
+
+    assert [key[0] for key in base._ENCODE_CACHE] == images[1:]
+    assert base._encode_cache_bytes == entry_size * 2
+
+    # Larger than the whole budget: returned but not cached
+    huge = tmp_path / "huge.png"
+    huge.write_bytes(b"x" * 200)
+    assert client._encode_image(huge).endswith(base64.b64encode(huge.read_bytes()))
+    assert str(huge) not in [key[0] for key in base._ENCODE_CACHE]
+    client.close()
+    base._clear_encode_cache()
+
+
+def test_vision_result_is_frozen():
+    """Test that VisionResult is immutable and has no per-instance __dict__."""
+    result = VisionResult(description="test")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.description = "changed"
+    assert not hasattr(result, "__dict__")
@@ -0,0 +1,146 @@
+"""Tests for the Ollama vision client."""
+
+import asyncio
+import base64
+import json
+
+import httpx
+import pytest
+
+from agent_tools.vision import ollama
+from agent_tools.vision.ollama import OllamaVisionClient
+
+
+def _client(handler):
+    client = OllamaVisionClient(host="http://ollama:11434/")
+    client._http.close()
+    client._http = httpx.Client(base_url=client.host, transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_analyze_image_request_body(tmp_path):
+    """Test that the image data URL is spliced into a valid JSON request body."""
+    image = tmp_path / "diagram.png"
+    image.write_bytes(b"\x89PNG fake image")
+    sent = {}
+
+    def handler(request):
+        sent["url"] = str(request.url)
+        sent["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "a diagram"}}]})
+
+    # A prompt equal to the placeholder must not receive the image
+    prompt = ollama._IMG_PLACEHOLDER
+    with _client(handler) as client:
+        result = client.analyze_image(image, prompt)
+
+    assert result.description == "a diagram"
+    assert sent["body"]["stream"] is True
+    assert sent["body"]["stream_options"] == {"include_usage": True}
+    assert sent["url"] == "http://ollama:11434/v1/chat/completions"
+    text_part, image_part = sent["body"]["messages"][0]["content"]
+    assert text_part == {"type": "text", "text": prompt}
+    expected = "data:image/png;base64," + base64.b64encode(image.read_bytes()).decode()
+    assert image_part["image_url"]["url"] == expected
+
+
+def test_analyze_image_streams_tokens(tmp_path):
+    """Test that SSE chunks are joined and passed to on_token as they arrive."""
+    image = tmp_path / "diagram.png"
+    image.write_bytes(b"\x89PNG fake image")
+    chunks = ["a ", "stream", "ed diagram"]
+    frames = [
+        {"id": "c1", "choices": [{"index": 0, "delta": {"content": c}, "finish_reason": None}]}
+        for c in chunks
+    ]
+    frames.append({"id": "c1", "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+    usage = {"prompt_tokens": 812, "completion_tokens": 3, "total_tokens": 815}
+    frames.append({"id": "c1", "choices": [], "usage": usage})
+    sse = "".join(f"data: {json.dumps(f)}\n\n" for f in frames) + "data: [DONE]\n\n"
+
+    def handler(request):
+        return httpx.Response(
+            200, headers={"Content-Type": "text/event-stream"}, content=sse.encode()
+        )
+
+    tokens = []
+    with _client(handler) as client:
+        result = client.analyze_image(image, "Describe", on_token=tokens.append)
+
+    assert tokens == chunks
+    assert result.description == "a streamed diagram"
+    assert result.raw_response["id"] == "c1"
+    assert result.raw_response["choices"][0]["message"]["content"] == "a streamed diagram"
+    assert result.raw_response["choices"][0]["finish_reason"] == "stop"
+    assert result.raw_response["usage"] == usage
+
+
+@pytest.mark.parametrize(
+    "sse",
+    [
+        'data: {"choices": [{"delta": {"content": "par"}}]}\n\n'
+        'data: {"error": {"message": "model crashed"}}\n\n',
+        'data: {"choices": [{"delta": {"content": "par"}}]}\n\n{"error": "model crashed"}\n',
+        'data: {"choices": [{"delta": {"content": "truncated"}}]}\n\n',
+        "",
+    ],
+    ids=["sse-error", "bare-error", "truncated", "empty"],
+)
+def test_analyze_image_stream_failure_raises(tmp_path, sse):
+    """Test that errors or an unfinished stream raise instead of returning partial text."""
+    image = tmp_path / "diagram.png"
+    image.write_bytes(b"\x89PNG fake image")
+
+    def handler(request):
+        return httpx.Response(
+            200, headers={"Content-Type": "text/event-stream"}, content=sse.encode()
+        )
+
+    with _client(handler) as client:
+        with pytest.raises(RuntimeError, match="Ollama API error"):
+            client.analyze_image(image, "Describe")
+
+
+def test_analyze_image_http_error(tmp_path):
+    """Test that HTTP errors surface as RuntimeError with the status code."""
+    image = tmp_path / "diagram.png"
+    image.write_bytes(b"\x89PNG fake image")
+
+    with _client(lambda request: httpx.Response(500, text="boom")) as client:
+        with pytest.raises(RuntimeError, match="Ollama API error: 500 - boom"):
+            client.analyze_image(image, "Describe")
+
+
+def test_analyze_images_batch_preserves_order(monkeypatch, tmp_path):
+    """Test that batched results come back in input order."""
+    images = []
+    for i in range(5):
+        image = tmp_path / f"img{i}.png"
+        image.write_bytes(b"fake %d" % i)
+        images.append(image)
+
+    async def handler(request):
+        prompt = json.loads(request.content)["messages"][0]["content"][0]["text"]
+        return httpx.Response(200, json={"choices": [{"message": {"content": prompt.upper()}}]})
+
+    client = OllamaVisionClient()
+    monkeypatch.setattr(
+        client,
+        "_async_client",
+        lambda concurrency, timeout: httpx.AsyncClient(
+            base_url=client.host, transport=httpx.MockTransport(handler)
+        ),
+    )
+    pairs = [(image, f"prompt {i}") for i, image in enumerate(images)]
+    results = asyncio.run(client.analyze_images_batch(pairs, concurrency=2))
+    client.close()
+
+    assert [r.description for r in results] == [f"PROMPT {i}" for i in range(5)]
+    assert all(r.model == client.default_model for r in results)
+
+
+def test_analyze_images_batch_rejects_unknown_options():
+    """Test that provider options Ollama doesn't support raise TypeError."""
+    with OllamaVisionClient() as client:
+        with pytest.raises(TypeError, match="max_tokens"):
+            asyncio.run(client.analyze_images_batch([], max_tokens=100))